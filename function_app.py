@@ -5,22 +5,33 @@
 # 쿼리/바디 파라미터:
 #   - date: "YYYY-MM-DD" (옵션, 기본=오늘 KST)
 #   - limit: int (옵션, 기본=40, 범위 1~80)
-#   - sleep: float 초 (옵션, 기본=0.7, 범위 0~2)
+#   - sleep: float 초 (옵션, 기본=0.7, 범위 0~2) - 429/5xx 재시도 시 지수 백오프 기준 시간
 #   - category_url: str (옵션, 기본=TechCrunch AI 카테고리)
 # 응답: { date_kst, count, items: [{url,title,published_utc,published_kst,body}] }
+# 로컬 실행: python function_app.py --date YYYY-MM-DD (파싱은 프로세스 풀에서 병렬 처리)
 # ------------------------------------------------------------
 
 import os
-import json
 import re
-import time
+import argparse
+import asyncio
+import hashlib
 import logging
-from urllib.parse import urljoin, urlparse
-from datetime import datetime, timezone
+import tempfile
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin
+from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo  # Python 3.9+
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from aiohttp_client_cache import CachedSession, FileBackend
+import ciso8601
+import orjson
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 import azure.functions as func
 
 app = func.FunctionApp()
@@ -33,66 +44,214 @@ HEADERS = {
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
-    )
+    ),
+    # brotli 설치 시 aiohttp가 br 응답을 자동 해제
+    "Accept-Encoding": "gzip, deflate, br",
 }
 
 KST = ZoneInfo("Asia/Seoul")
 
+# ISO8601 파서 (C 확장, 끝의 "Z"도 그대로 처리)
+_parse_iso = ciso8601.parse_datetime
+
+# 호출마다 다시 컴파일하지 않도록 미리 컴파일한 정규식
+_ARTICLE_PATH_RE = re.compile(r"/20\d{2}/\d{2}/")
+_URL_DATE_RE = re.compile(r"/(20\d{2})/(\d{2})/(\d{2})/")
+_HUMAN_DATE_RE = re.compile(
+    r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}"
+)
+
+# 기사 페이지 추출용 XPath (미리 컴파일, 문자열 결과는 일반 str로 반환)
+_LDJSON_XPATH = etree.XPath(
+    "//script[@type='application/ld+json']/text()", smart_strings=False
+)
+_META_PROPERTY_XPATH = etree.XPath("//meta[@property=$prop]/@content", smart_strings=False)
+_META_NAME_XPATH = etree.XPath("//meta[@name=$prop]/@content", smart_strings=False)
+_FOLLOWING_TEXT_XPATH = etree.XPath("following::text()[position() <= 60]", smart_strings=False)
+_TIME_SPAN_XPATH = etree.XPath("(//time | //span)[position() <= 50]")
+# 요소 하위 텍스트 (script/style 내용 제외)
+_TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(parent::script or parent::style)]", smart_strings=False
+)
+# 본문 문단 (aside/figcaption/nav/footer 안의 p 제외)
+_BODY_P_XPATH = etree.XPath(
+    ".//p[not(ancestor::aside or ancestor::figcaption or ancestor::nav or ancestor::footer)]"
+)
+
+# 기사 페이지 동시 요청 수 (호스트당 커넥션 상한과 동일)
+MAX_CONCURRENCY = 8
+
+# 일시적 오류(429/5xx, 연결 실패)에 대해서만 재시도: 최대 3회.
+# 대기 시간은 Retry-After 헤더, 없으면 backoff * 2^n (최대 RETRY_MAX_WAIT초)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.7
+RETRY_MAX_WAIT = 30
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# HTTP 응답 캐시 (Cache-Control 우선, 없으면 10분). 워밍된 인스턴스의 재호출 시 네트워크 생략
+HTTP_CACHE_DIR = os.environ.get(
+    "HTTP_CACHE_DIR", os.path.join(tempfile.gettempdir(), "tc_cache")
+)
+HTTP_CACHE_TTL = 600
+
+# 파싱 결과 캐시: (url, 본문 해시) -> 기사 dict. 본문이 같으면 파싱 생략
+ARTICLE_CACHE_SIZE = 256
+_article_cache: OrderedDict[tuple[str, bytes], dict] = OrderedDict()
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    모듈 단위로 공유하는 캐시 ClientSession (커넥션 풀 재사용).
+    세션은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = CachedSession(
+            cache=FileBackend(
+                cache_name=HTTP_CACHE_DIR,
+                expire_after=HTTP_CACHE_TTL,
+                cache_control=True,
+            ),
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=20),
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=MAX_CONCURRENCY,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+            ),
+        )
+        _session_loop = loop
+    return _session
 
-def fetch(url: str) -> requests.Response:
-    r = requests.get(url, headers=HEADERS, timeout=20)
-    r.raise_for_status()
-    return r
+
+async def fetch(url: str, backoff: float = RETRY_BACKOFF) -> bytes:
+    # 디코딩하지 않은 바이트를 그대로 반환 (파서 쪽에서 인코딩을 판별)
+    attempt = 0
+    while True:
+        retry_after = None
+        try:
+            async with get_session().get(url) as r:
+                if r.status not in RETRY_STATUSES or attempt >= RETRY_TOTAL:
+                    r.raise_for_status()
+                    return await r.read()
+                retry_after = _retry_after_seconds(r.headers.get("Retry-After"))
+        except aiohttp.ClientConnectionError:
+            if attempt >= RETRY_TOTAL:
+                raise
+        # 커넥션을 풀에 돌려준 뒤, 서버가 요청한 만큼(없으면 지수 백오프) 대기
+        delay = retry_after if retry_after is not None else backoff * 2**attempt
+        await asyncio.sleep(min(delay, RETRY_MAX_WAIT))
+        attempt += 1
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    # Retry-After: 초 단위 숫자 또는 HTTP 날짜
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
 
 
-def get_article_links(category_url: str = CATEGORY_URL, limit: int = 50):
+async def get_article_links(
+    category_url: str = CATEGORY_URL, limit: int = 50, backoff: float = RETRY_BACKOFF
+):
     """
     카테고리 페이지에서 기사 링크를 최대 limit개까지 수집.
     """
-    html = fetch(category_url).text
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
-
-    # 1) h3 내부의 앵커
-    for h3 in soup.find_all("h3"):
-        a = h3.find("a", href=True)
-        if a and is_article_url(a["href"]):
-            links.add(normalize_link(a["href"]))
-
-    # 2) 보강: 모든 a 중 연-월 패턴 포함 URL
-    if len(links) < limit:
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if is_article_url(href):
-                links.add(normalize_link(href))
-            if len(links) >= limit:
+    html = await fetch(category_url, backoff)
+    # 링크 수집에 필요한 h3/a 노드만 트리로 구성
+    soup = BeautifulSoup(html, "lxml", parse_only=SoupStrainer(["h3", "a"]))
+    # dict를 순서 유지 집합으로 사용: 1) h3 내부 앵커 우선, 2) 그 외 앵커로 보강
+    h3_links = {}
+    other_links = {}
+
+    # 연-월 패턴을 포함한 앵커를 문서 순서대로 한 번만 순회
+    for a in soup.find_all("a", href=True):
+        href = a["href"]
+        if not is_article_url(href):
+            continue
+        link = normalize_link(href)
+        if a.find_parent("h3") is not None:
+            h3_links[link] = None
+            other_links.pop(link, None)
+            # h3 링크만으로 채워지면 이후 앵커는 결과에 영향 없음
+            if len(h3_links) >= limit:
                 break
+        elif link not in h3_links:
+            other_links[link] = None
 
+    links = h3_links | other_links
     return list(links)[:limit]
 
 
 def is_article_url(href: str) -> bool:
     """
     TechCrunch 기사 URL은 일반적으로 /YYYY/MM/ 형태를 가짐.
+    urlparse 없이 문자열 검사 후 정규식만 적용.
     """
-    try:
-        u = urlparse(href)
-        path = u.path
-        return (
-            ("techcrunch.com" in u.netloc or u.netloc == "")
-            and re.search(r"/20\d{2}/\d{2}/", path) is not None
-        )
-    except Exception:
+    if not href:
+        return False
+    # 사이트 내부 상대 경로 ("//host/..."는 외부 호스트일 수 있으므로 제외)
+    if href.startswith("/") and not href.startswith("//"):
+        return _ARTICLE_PATH_RE.search(href) is not None
+    if "techcrunch.com" not in href:
         return False
+    return _ARTICLE_PATH_RE.search(href) is not None
 
 
 def normalize_link(href: str) -> str:
     return urljoin(CATEGORY_URL, href)
 
 
-def parse_article(url: str):
+def url_date_utc(url: str) -> date | None:
+    """
+    기사 URL 경로의 /YYYY/MM/DD/ 날짜. 없거나 잘못된 날짜면 None.
+    """
+    m = _URL_DATE_RE.search(url)
+    if not m:
+        return None
+    try:
+        return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    except ValueError:
+        return None
+
+
+async def parse_article(url: str, backoff: float = RETRY_BACKOFF):
+    """
+    기사 페이지를 받아 parse_html_bytes로 파싱. 본문이 같으면 캐시된 결과를 반환.
     """
-    기사 페이지에서 제목, 본문, 발행일시(UTC/KST 변환)를 파싱.
+    html = await fetch(url, backoff)
+    cache_key = (url, hashlib.blake2b(html, digest_size=16).digest())
+    cached = _article_cache.get(cache_key)
+    if cached is not None:
+        _article_cache.move_to_end(cache_key)
+        return dict(cached)
+
+    art = parse_html_bytes(url, html)
+    _article_cache[cache_key] = art
+    if len(_article_cache) > ARTICLE_CACHE_SIZE:
+        _article_cache.popitem(last=False)
+    return dict(art)
+
+
+def parse_html_bytes(url: str, html: bytes):
+    """
+    기사 HTML에서 제목, 본문, 발행일시(UTC/KST 변환)를 파싱 (네트워크 없음, 순수 CPU 작업).
+    lxml 트리 하나만 만들고 모든 추출을 XPath로 처리.
     발행일 우선순위:
       1) <meta property="article:published_time" content="ISO8601">
       2) JSON-LD(NewsArticle/BlogPosting) 내 datePublished
@@ -102,23 +261,25 @@ def parse_article(url: str):
       1) JSON-LD의 articleBody
       2) <article> 내 <p>들 연결
     """
-    res = fetch(url)
-    soup = BeautifulSoup(res.text, "html.parser")
+    tree = parse_html_tree(html)
 
     # 제목
-    title = soup.find("h1")
-    title_text = title.get_text(strip=True) if title else ""
+    title = tree.find(".//h1")
+    title_text = _text(title) if title is not None else ""
+
+    # JSON-LD는 발행일/본문을 한 번에 추출
+    ld_dt, ld_body = _scan_ldjson(tree)
 
     # 발행일
     published_dt = (
-        get_meta_datetime(soup, "article:published_time")
-        or get_ldjson_datetime(soup)
-        or get_time_tag_datetime(soup)
-        or get_text_datetime_fallback(soup)
+        get_meta_datetime(tree, "article:published_time")
+        or ld_dt
+        or get_time_tag_datetime(tree)
+        or get_text_datetime_fallback(tree, title)
     )
 
     # 본문
-    body_text = get_ldjson_article_body(soup) or extract_paragraphs(soup)
+    body_text = ld_body or extract_paragraphs(tree)
 
     return {
         "url": url,
@@ -130,64 +291,97 @@ def parse_article(url: str):
         if published_dt
         else None,
         "body": (body_text or "").strip(),
+        # 필터링용 원본 datetime (응답 전에 제거)
+        "_published_dt": published_dt,
     }
 
 
-def get_meta_datetime(soup: BeautifulSoup, prop: str):
-    tag = soup.find("meta", attrs={"property": prop}) or soup.find(
-        "meta", attrs={"name": prop}
-    )
-    if tag and tag.get("content"):
+def parse_html_tree(html: bytes) -> lxml.html.HtmlElement:
+    # charset 선언이 없는 UTF-8 문서를 latin-1로 오인하지 않도록 먼저 UTF-8로 디코딩,
+    # 실패하거나 XML 인코딩 선언이 있으면 lxml의 자체 판별에 맡김
+    try:
+        return lxml.html.document_fromstring(html.decode("utf-8"))
+    except ValueError:
+        return lxml.html.document_fromstring(html)
+
+
+def _text(el, sep: str = "") -> str:
+    # BeautifulSoup의 get_text(sep, strip=True)와 같은 규칙
+    return sep.join(t.strip() for t in _TEXT_XPATH(el) if t.strip())
+
+
+def get_meta_datetime(tree: lxml.html.HtmlElement, prop: str):
+    contents = _META_PROPERTY_XPATH(tree, prop=prop) or _META_NAME_XPATH(tree, prop=prop)
+    if contents and contents[0]:
         try:
-            return datetime.fromisoformat(tag["content"].replace("Z", "+00:00"))
+            return _parse_iso(contents[0])
         except Exception:
             return None
     return None
 
 
-def get_ldjson_datetime(soup: BeautifulSoup):
-    for s in soup.find_all("script", type="application/ld+json"):
+def _scan_ldjson(tree: lxml.html.HtmlElement) -> tuple[datetime | None, str | None]:
+    """
+    JSON-LD(NewsArticle/Article/BlogPosting) 블록을 한 번만 순회/파싱해
+    (datePublished, articleBody)를 함께 반환. 둘 다 찾으면 즉시 종료.
+    """
+    published_dt = None
+    body = None
+    for s in _LDJSON_XPATH(tree):
         try:
-            data = json.loads(s.string or "")
-            candidates = data if isinstance(data, list) else [data]
-            for obj in candidates:
-                if isinstance(obj, dict) and obj.get("@type") in {
-                    "NewsArticle",
-                    "Article",
-                    "BlogPosting",
-                }:
-                    dp = obj.get("datePublished") or obj.get("dateCreated")
-                    if dp:
-                        return datetime.fromisoformat(dp.replace("Z", "+00:00"))
+            data = orjson.loads(s)
         except Exception:
             continue
-    return None
-
-
-def get_time_tag_datetime(soup: BeautifulSoup):
-    t = soup.find("time")
-    if t and t.get("datetime"):
+        candidates = data if isinstance(data, list) else [data]
+        for obj in candidates:
+            if not (
+                isinstance(obj, dict)
+                and obj.get("@type") in {"NewsArticle", "Article", "BlogPosting"}
+            ):
+                continue
+            if published_dt is None:
+                dp = obj.get("datePublished") or obj.get("dateCreated")
+                if dp:
+                    try:
+                        published_dt = _parse_iso(dp)
+                    except Exception:
+                        pass
+            if body is None:
+                body = obj.get("articleBody") or None
+            if published_dt is not None and body is not None:
+                return published_dt, body
+    return published_dt, body
+
+
+def get_time_tag_datetime(tree: lxml.html.HtmlElement):
+    t = tree.find(".//time")
+    if t is None:
+        return None
+    if t.get("datetime"):
         try:
-            return datetime.fromisoformat(t["datetime"].replace("Z", "+00:00"))
+            return _parse_iso(t.get("datetime"))
         except Exception:
             pass
     # 화면표시 텍스트에 월 일, 연도 패턴이 있을 수 있음
-    if t and t.get_text(strip=True):
-        return parse_human_datetime(t.get_text(" ", strip=True))
+    text = _text(t, " ")
+    if text:
+        return parse_human_datetime(text)
     return None
 
 
-def get_text_datetime_fallback(soup: BeautifulSoup):
-    text = soup.get_text(" ", strip=True)
+def get_text_datetime_fallback(tree: lxml.html.HtmlElement, title=None):
+    # 문서 전체를 직렬화하지 않고 제목(h1) 주변의 짧은 텍스트만 검사
+    if title is not None:
+        texts = [_text(title, " "), *_FOLLOWING_TEXT_XPATH(title)]
+    else:
+        texts = [_text(t, " ") for t in _TIME_SPAN_XPATH(tree)]
+    text = " ".join(t.strip() for t in texts if t.strip())
     return parse_human_datetime(text)
 
 
 def parse_human_datetime(text: str):
     # 예: "September 10, 2025" 또는 "10:10 PM PDT · September 10, 2025"
-    m = re.search(
-        r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}",
-        text,
-    )
+    m = _HUMAN_DATE_RE.search(text)
     if m:
         try:
             d = datetime.strptime(m.group(0), "%B %d, %Y")
@@ -198,70 +392,119 @@ def parse_human_datetime(text: str):
     return None
 
 
-def get_ldjson_article_body(soup: BeautifulSoup):
-    for s in soup.find_all("script", type="application/ld+json"):
-        try:
-            data = json.loads(s.string or "")
-            candidates = data if isinstance(data, list) else [data]
-            for obj in candidates:
-                if isinstance(obj, dict) and obj.get("@type") in {
-                    "NewsArticle",
-                    "Article",
-                    "BlogPosting",
-                }:
-                    body = obj.get("articleBody")
-                    if body:
-                        return body
-        except Exception:
-            continue
-    return None
-
-
-def extract_paragraphs(soup: BeautifulSoup):
+def extract_paragraphs(tree: lxml.html.HtmlElement):
     # 기사 본문 컨테이너 추정: <article> 내부 p 수집(aside/figure/nav 등 제외)
-    article = soup.find("article") or soup
+    article = tree.find(".//article")
+    if article is None:
+        article = tree
     paragraphs = []
-    for p in article.find_all("p"):
-        bad = p.find_parent(["aside", "figcaption", "nav", "footer"])
-        if bad:
-            continue
-        txt = p.get_text(" ", strip=True)
+    for p in _BODY_P_XPATH(article):
+        txt = _text(p, " ")
         if len(txt) >= 2:
             paragraphs.append(txt)
     return "\n\n".join(paragraphs)
 
 
-def is_today_kst(dt: datetime, today_kst: datetime):
-    if not dt:
-        return False
-    return dt.astimezone(KST).date() == today_kst.date()
+async def crawl_today(
+    category_url: str = CATEGORY_URL,
+    today_kst: datetime | None = None,
+    limit: int = 40,
+    sleep_sec: float = 0.7,
+):
+    if today_kst is None:
+        today_kst = datetime.now(KST)
+    target_date = today_kst.date()
+    links = await get_candidate_links(category_url, target_date, limit, sleep_sec)
+    arts = await gather_bounded(parse_article, links, sleep_sec)
+    return select_today(links, arts, target_date)
 
 
-def crawl_today(
+def crawl_today_local(
     category_url: str = CATEGORY_URL,
     today_kst: datetime | None = None,
     limit: int = 40,
     sleep_sec: float = 0.7,
+    workers: int | None = None,
 ):
+    """
+    Azure 밖(로컬 CLI)용 경로: HTML은 비동기로 동시에 받고,
+    GIL에 묶이는 파싱은 프로세스 풀에서 코어별로 병렬 처리.
+    """
     if today_kst is None:
         today_kst = datetime.now(KST)
-    links = get_article_links(category_url, limit=limit)
-    results = []
-    for url in links:
+    target_date = today_kst.date()
+
+    async def fetch_all():
         try:
-            art = parse_article(url)
-            if art["published_kst"] and is_today_kst(
-                datetime.fromisoformat(art["published_kst"]), today_kst
-            ):
-                results.append(art)
-        except Exception as e:
-            logger.warning("Parse failed for %s: %s", url, e)
-        time.sleep(sleep_sec)  # 예의상 천천히
+            links = await get_candidate_links(category_url, target_date, limit, sleep_sec)
+            return links, await gather_bounded(fetch, links, sleep_sec)
+        finally:
+            await get_session().close()
+
+    links, bodies = asyncio.run(fetch_all())
+
+    arts = []
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [
+            None if isinstance(body, BaseException) else ex.submit(parse_html_bytes, url, body)
+            for url, body in zip(links, bodies)
+        ]
+        for body, fut in zip(bodies, futures):
+            if fut is None:
+                arts.append(body)
+                continue
+            try:
+                arts.append(fut.result())
+            except Exception as e:
+                arts.append(e)
+    return select_today(links, arts, target_date)
+
+
+async def get_candidate_links(
+    category_url: str, target_date: date, limit: int, backoff: float = RETRY_BACKOFF
+):
+    links = await get_article_links(category_url, limit=limit, backoff=backoff)
+
+    # URL 날짜로 미리 거르기 (KST/UTC 경계를 고려해 ±1일 허용, 날짜 없는 URL은 유지)
+    one_day = timedelta(days=1)
+    window = {target_date - one_day, target_date, target_date + one_day}
+    candidates = []
+    for url in links:
+        udate = url_date_utc(url)
+        if udate is None or udate in window:
+            candidates.append(url)
+    return candidates
+
+
+async def gather_bounded(coro_fn, urls: list[str], backoff: float = RETRY_BACKOFF):
+    """
+    MAX_CONCURRENCY개 슬롯으로 coro_fn(url, backoff)을 동시에 실행. 실패는 예외 객체로 반환.
+    요청 사이 고정 대기는 없고, 서버가 429/5xx로 신호할 때만 fetch가 물러남.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def bounded(url: str):
+        async with sem:
+            return await coro_fn(url, backoff)
+
+    tasks = [asyncio.create_task(bounded(url)) for url in urls]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def select_today(links: list[str], arts: list, target_date: date):
+    results = []
+    for url, art in zip(links, arts):
+        if isinstance(art, BaseException):
+            logger.warning("Parse failed for %s: %s", url, art)
+            continue
+        published_dt = art.pop("_published_dt")
+        if published_dt and published_dt.astimezone(KST).date() == target_date:
+            results.append(art)
     return results
 
 
 @app.route(route="ai-today", methods=["GET", "POST"], auth_level=func.AuthLevel.FUNCTION)
-def ai_today(req: func.HttpRequest) -> func.HttpResponse:
+async def ai_today(req: func.HttpRequest) -> func.HttpResponse:
     """
     TechCrunch AI 카테고리에서 '오늘자(KST)' 기사만 크롤링하여 JSON으로 반환.
     """
@@ -291,7 +534,7 @@ def ai_today(req: func.HttpRequest) -> func.HttpResponse:
                 today_kst = datetime(yyyy, mm, dd, tzinfo=KST)
             except Exception:
                 return func.HttpResponse(
-                    json.dumps({"error": "invalid date format, use YYYY-MM-DD"}),
+                    orjson.dumps({"error": "invalid date format, use YYYY-MM-DD"}),
                     status_code=400,
                     mimetype="application/json",
                 )
@@ -315,7 +558,7 @@ def ai_today(req: func.HttpRequest) -> func.HttpResponse:
             except Exception:
                 pass
 
-        items = crawl_today(
+        items = await crawl_today(
             category_url=category_url, today_kst=today_kst, limit=limit, sleep_sec=sleep_sec
         )
 
@@ -325,7 +568,7 @@ def ai_today(req: func.HttpRequest) -> func.HttpResponse:
             "items": items,
         }
         return func.HttpResponse(
-            json.dumps(out, ensure_ascii=False),
+            orjson.dumps(out),
             status_code=200,
             mimetype="application/json",
         )
@@ -333,7 +576,43 @@ def ai_today(req: func.HttpRequest) -> func.HttpResponse:
     except Exception as e:
         logger.exception("Unhandled error in ai-today")
         return func.HttpResponse(
-            json.dumps({"error": "internal_error", "detail": str(e)}),
+            orjson.dumps({"error": "internal_error", "detail": str(e)}),
             status_code=500,
             mimetype="application/json",
         )
+
+
+def main():
+    """
+    로컬 실행: python function_app.py [--date YYYY-MM-DD] [--limit N] [--workers N]
+    """
+    parser = argparse.ArgumentParser(description="TechCrunch AI 카테고리 오늘(KST) 기사 크롤링")
+    parser.add_argument("--date", help="YYYY-MM-DD (기본=오늘 KST)")
+    parser.add_argument("--limit", type=int, default=40)
+    parser.add_argument("--sleep", type=float, default=0.7, help="재시도 백오프 기준 시간(초)")
+    parser.add_argument("--category-url", default=CATEGORY_URL)
+    parser.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본=CPU 수)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    today_kst = datetime.now(KST)
+    if args.date:
+        today_kst = datetime.strptime(args.date, "%Y-%m-%d").replace(tzinfo=KST)
+
+    items = crawl_today_local(
+        category_url=args.category_url,
+        today_kst=today_kst,
+        limit=args.limit,
+        sleep_sec=args.sleep,
+        workers=args.workers,
+    )
+    out = {
+        "date_kst": today_kst.strftime("%Y-%m-%d"),
+        "count": len(items),
+        "items": items,
+    }
+    print(orjson.dumps(out, option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()